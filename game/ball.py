@@ -5,9 +5,8 @@ from .brick import Brick
 
 class Ball:
     def __init__(self):
-        self.image = pygame.Surface((20,20))
-        self.image.fill(settings.WHITE)
-        self.rect = self.image.get_rect(center = (settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT - 120)) # initialize the ball right above the paddle
+        self.rect = pygame.Rect(0, 0, 20, 20)
+        self.rect.center = (settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT - 120) # initialize the ball right above the paddle
         self.speed = 5
         self.angle = 0
         self.velocity_x = self.speed * math.sin(self.angle)
@@ -113,13 +112,3 @@ class Ball:
 
         # Ensure the ball stays within the screen
         self.rect.clamp_ip(pygame.Rect(0, 0, settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
-
-    def draw(self, screen):
-        # Draw trail
-        for i, pos in enumerate(self.history):
-             alpha = int((i / len(self.history)) * 255)
-             trail_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-             pygame.draw.circle(trail_surface, (*settings.WHITE, alpha), (self.rect.width//2, self.rect.height//2), self.rect.width//2)
-             screen.blit(trail_surface, (pos[0] - self.rect.width//2, pos[1] - self.rect.height//2))
-
-        screen.blit(self.image, self.rect)
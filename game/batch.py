@@ -0,0 +1,212 @@
+import math
+import numpy as np
+import settings
+
+BALL_SIZE = 20
+BALL_SPEED = 5
+PADDLE_WIDTH = 100
+PADDLE_HEIGHT = 20
+PADDLE_SPEED = 10
+BRICK_COLUMNS = settings.SCREEN_WIDTH // settings.BRICK_WIDTH
+ROW_GAP = settings.BRICK_HEIGHT * 2
+# enough ring slots for every row that can be on screen at once
+BRICK_ROWS = settings.SCREEN_HEIGHT // ROW_GAP + 2
+MAX_BOUNCE_ANGLE = math.radians(45)
+
+# Steps N independent games at once. State is kept as struct-of-arrays, one entry
+# per game, and every rule from Ball/Paddle/Game.update is applied as array maths
+# so a single step() call advances the whole batch by one tick.
+class BatchGame:
+    def __init__(self, n, seed=None):
+        self.n = n
+        self.rng = np.random.default_rng(seed)
+        self.brick_frequency = (ROW_GAP / settings.BRICK_SPEED) * 1000
+
+        self.ball_x = np.zeros(n)
+        self.ball_y = np.zeros(n)
+        self.velocity_x = np.zeros(n)
+        self.velocity_y = np.zeros(n)
+        self.paddle_x = np.zeros(n)
+
+        # brick field as a ring buffer of rows: y offset per row, occupancy and color per cell
+        self.row_y = np.zeros((n, BRICK_ROWS))
+        self.row_live = np.zeros((n, BRICK_ROWS), dtype=bool)
+        self.bricks = np.zeros((n, BRICK_ROWS, BRICK_COLUMNS), dtype=bool)
+        self.brick_colors = np.zeros((n, BRICK_ROWS, BRICK_COLUMNS), dtype=np.uint8)
+        self.next_row = np.zeros(n, dtype=np.intp)
+
+        self.elapsed_time = np.zeros(n)
+        self.last_brick_time = np.zeros(n)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.frames = np.zeros(n, dtype=np.int64)
+        self.bricks_destroyed = np.zeros(n, dtype=np.int64)
+        self.game_over = np.zeros(n, dtype=bool)
+
+        self._brick_left = np.arange(BRICK_COLUMNS) * settings.BRICK_WIDTH
+        self._games = np.arange(n)
+        self.reset()
+
+    def reset(self, mask=None):
+        # reset every game, or only the ones selected by a boolean mask
+        games = self._games if mask is None else self._games[mask]
+        self.ball_x[games] = settings.SCREEN_WIDTH // 2 - BALL_SIZE // 2
+        self.ball_y[games] = settings.SCREEN_HEIGHT - 120 - BALL_SIZE // 2
+        self.velocity_x[games] = 0.0
+        self.velocity_y[games] = -BALL_SPEED
+        self.paddle_x[games] = settings.SCREEN_WIDTH // 2 - PADDLE_WIDTH // 2
+        self.row_y[games] = 0.0
+        self.row_live[games] = False
+        self.bricks[games] = False
+        self.next_row[games] = 0
+        self.elapsed_time[games] = 0.0
+        self.last_brick_time[games] = 0.0
+        self.score[games] = 0
+        self.frames[games] = 0
+        self.bricks_destroyed[games] = 0
+        self.game_over[games] = False
+
+    @property
+    def paddle_y(self):
+        return settings.SCREEN_HEIGHT - 100 - PADDLE_HEIGHT // 2
+
+    def step(self, directions=None, dt=1 / settings.FPS):
+        # advance every running game by one tick; directions holds -1/0/1 paddle input per game
+        active = ~self.game_over
+        if not active.any():
+            return
+
+        if directions is not None:
+            self._move_paddles(np.where(active, directions, 0))
+        self._move_balls(active)
+        self._collide_paddles(active)
+        self._collide_bricks(active)
+        self._spawn_rows(active, dt)
+
+        # scroll every live row of every running game
+        self.row_y += np.where(active[:, None] & self.row_live, settings.BRICK_SPEED * dt, 0.0)
+        self._check_game_over(active)
+        self._cull_rows()
+        self.frames += active
+
+    def _move_paddles(self, directions):
+        self.paddle_x += directions * PADDLE_SPEED
+        np.clip(self.paddle_x, 0, settings.SCREEN_WIDTH - PADDLE_WIDTH, out=self.paddle_x)
+
+    def _move_balls(self, active):
+        self.ball_x += np.where(active, self.velocity_x, 0.0)
+        self.ball_y += np.where(active, self.velocity_y, 0.0)
+
+        # Bounce off the walls, then keep the ball within the screen
+        hit_side = (self.ball_x <= 0) | (self.ball_x + BALL_SIZE >= settings.SCREEN_WIDTH)
+        hit_end = (self.ball_y <= 0) | (self.ball_y + BALL_SIZE >= settings.SCREEN_HEIGHT)
+        self.velocity_x = np.where(active & hit_side, -self.velocity_x, self.velocity_x)
+        self.velocity_y = np.where(active & hit_end, -self.velocity_y, self.velocity_y)
+        np.clip(self.ball_x, 0, settings.SCREEN_WIDTH - BALL_SIZE, out=self.ball_x)
+        np.clip(self.ball_y, 0, settings.SCREEN_HEIGHT - BALL_SIZE, out=self.ball_y)
+
+    def _collide_paddles(self, active):
+        paddle_y = self.paddle_y
+        hit = (active
+               & (self.ball_x < self.paddle_x + PADDLE_WIDTH) & (self.ball_x + BALL_SIZE > self.paddle_x)
+               & (self.ball_y < paddle_y + PADDLE_HEIGHT) & (self.ball_y + BALL_SIZE > paddle_y))
+        if not hit.any():
+            return
+
+        # same angle rule as Ball.check_collision_with_paddle
+        hit_offset = (self.ball_x + BALL_SIZE / 2) - (self.paddle_x + PADDLE_WIDTH / 2)
+        new_angle = hit_offset / (PADDLE_WIDTH / 2) * MAX_BOUNCE_ANGLE
+        self.velocity_x = np.where(hit, BALL_SPEED * np.sin(new_angle), self.velocity_x)
+        self.velocity_y = np.where(hit, -BALL_SPEED * np.cos(new_angle), self.velocity_y)
+
+    def _collide_bricks(self, active):
+        # bricks sit on a fixed column grid, so overlap splits into a column test and a row test
+        brick_top = np.floor(self.row_y)
+        in_column = ((self.ball_x[:, None] < self._brick_left + settings.BRICK_WIDTH)
+                     & (self.ball_x[:, None] + BALL_SIZE > self._brick_left))
+        in_row = (self.row_live & active[:, None]
+                  & (self.ball_y[:, None] < brick_top + settings.BRICK_HEIGHT)
+                  & (self.ball_y[:, None] + BALL_SIZE > brick_top))
+        hits = self.bricks & in_row[:, :, None] & in_column[:, None, :]
+        hit_count = hits.sum(axis=(1, 2))
+        struck = hit_count > 0
+        if not struck.any():
+            return
+
+        # the nearest struck brick decides the bounce, as in Ball.check_collision_with_bricks
+        center_x = self.ball_x + BALL_SIZE / 2
+        center_y = self.ball_y + BALL_SIZE / 2
+        dx = (self._brick_left + settings.BRICK_WIDTH / 2) - center_x[:, None]
+        dy = (brick_top + settings.BRICK_HEIGHT / 2) - center_y[:, None]
+        distance = dy[:, :, None] ** 2 + dx[:, None, :] ** 2
+        nearest = np.where(hits, distance, np.inf).reshape(self.n, -1).argmin(axis=1)
+        row = nearest // BRICK_COLUMNS
+        left = self._brick_left[nearest % BRICK_COLUMNS]
+        top = brick_top[self._games, row]
+        self._bounce_off_bricks(struck, center_x, center_y, left, top)
+
+        self.bricks &= ~hits
+        self.score += hit_count * 10
+        self.bricks_destroyed += hit_count
+
+    def _bounce_off_bricks(self, struck, center_x, center_y, left, top):
+        # vectorised Ball.get_collision_point: cast a ray of one radius along the
+        # velocity and find where it first crosses one of the brick's four sides
+        right = left + settings.BRICK_WIDTH
+        bottom = top + settings.BRICK_HEIGHT
+        radius = BALL_SIZE / 2
+        speed = np.hypot(self.velocity_x, self.velocity_y)
+        speed[speed == 0] = 1.0
+        ray_x = self.velocity_x / speed * radius
+        ray_y = self.velocity_y / speed * radius
+
+        best_t = np.full(self.n, np.inf)
+        point_x = center_x.copy()
+        point_y = center_y.copy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for edge_x in (left, right):
+                t = (edge_x - center_x) / ray_x
+                y = center_y + t * ray_y
+                ok = (ray_x != 0) & (t >= 0) & (t <= 1) & (y >= top) & (y <= bottom) & (t < best_t)
+                best_t = np.where(ok, t, best_t)
+                point_x = np.where(ok, edge_x, point_x)
+                point_y = np.where(ok, y, point_y)
+            for edge_y in (top, bottom):
+                t = (edge_y - center_y) / ray_y
+                x = center_x + t * ray_x
+                ok = (ray_y != 0) & (t >= 0) & (t <= 1) & (x >= left) & (x <= right) & (t < best_t)
+                best_t = np.where(ok, t, best_t)
+                point_x = np.where(ok, x, point_x)
+                point_y = np.where(ok, edge_y, point_y)
+
+        flip_x = struck & ((point_x <= left) | (point_x >= right))
+        flip_y = struck & ((point_y <= top) | (point_y >= bottom))
+        self.velocity_x = np.where(flip_x, -self.velocity_x, self.velocity_x)
+        self.velocity_y = np.where(flip_y, -self.velocity_y, self.velocity_y)
+
+    def _spawn_rows(self, active, dt):
+        self.elapsed_time += np.where(active, dt * 1000, 0.0)
+        due = active & (self.elapsed_time - self.last_brick_time > self.brick_frequency)
+        games = self._games[due]
+        if games.size == 0:
+            return
+
+        slots = self.next_row[games]
+        self.row_y[games, slots] = 0.0
+        self.row_live[games, slots] = True
+        self.bricks[games, slots] = True
+        self.brick_colors[games, slots] = self.rng.integers(
+            len(settings.colors), size=(games.size, BRICK_COLUMNS), dtype=np.uint8)
+        self.next_row[games] = (slots + 1) % BRICK_ROWS
+        self.last_brick_time[games] = self.elapsed_time[games]
+
+    def _check_game_over(self, active):
+        # bricks reaching paddle level end the game
+        reached = (np.floor(self.row_y) + settings.BRICK_HEIGHT >= self.paddle_y) & self.row_live
+        self.game_over |= active & (reached & self.bricks.any(axis=2)).any(axis=1)
+
+    def _cull_rows(self):
+        # Remove rows that have fallen off the screen
+        gone = self.row_live & (np.floor(self.row_y) >= settings.SCREEN_HEIGHT)
+        if gone.any():
+            self.row_live &= ~gone
+            self.bricks &= ~gone[:, :, None]
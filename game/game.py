@@ -5,32 +5,38 @@ from .paddle import Paddle
 from .ball import Ball
 from .brick import Brick
 from .particle import Particle
+from .renderer import Renderer
 
 class Game:
-    def __init__(self):
-        pygame.init()
-        self.screen = pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    def __init__(self, headless=False):
+        # headless games keep the simulation but never open a window or load a font
+        self.headless = headless
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 36)  # Default font, size 36
+        self.renderer = None
+        if not headless:
+            pygame.init()
+            self.renderer = Renderer()
         self.reset_game()
-        self.game_state = "SPLASH"  # Initial game state
+        self.game_state = "PLAYING" if headless else "SPLASH"  # Initial game state
 
         # Screen shake
         self.shake_duration = 0
         self.shake_magnitude = 0
-        self.canvas = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
 
     def reset_game(self):
         self.paddle = Paddle()
         self.ball = Ball()
         self.bricks = pygame.sprite.Group()
         self.particles = pygame.sprite.Group()
-        self.last_brick_time = pygame.time.get_ticks()
+        # simulated clock in ms, advanced by update() so headless runs spawn bricks on schedule
+        self.elapsed_time = 0
+        self.last_brick_time = 0
         vertical_gap = settings.BRICK_HEIGHT * 2
         self.brick_frequency = (vertical_gap / settings.BRICK_SPEED) * 1000
         self.game_over = False
         self.active = True
         self.score = 0
+        self.bricks_destroyed = 0
 
     def trigger_shake(self, magnitude, duration):
         self.shake_magnitude = magnitude
@@ -66,11 +72,12 @@ class Game:
             self.spawn_particles(brick.rect.center, brick.color)
             self.trigger_shake(3, 5)
             self.score += 10
+            self.bricks_destroyed += 1
 
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_brick_time > self.brick_frequency:
+        self.elapsed_time += dt * 1000
+        if self.elapsed_time - self.last_brick_time > self.brick_frequency:
             self.add_brick_row()
-            self.last_brick_time = current_time
+            self.last_brick_time = self.elapsed_time
 
         self.bricks.update(dt)
         self.particles.update(dt)
@@ -93,31 +100,8 @@ class Game:
              self.shake_magnitude = 0
 
     def draw(self):
-        if self.game_state == "SPLASH":
-            self.draw_splash_screen()
-        elif self.game_state == "PLAYING":
-            self.canvas.fill(settings.BLACK)
-            self.paddle.draw(self.canvas)
-            self.ball.draw(self.canvas)
-            self.bricks.draw(self.canvas)
-            self.particles.draw(self.canvas)
-
-            # Score
-            score_text = self.font.render(f"Score: {self.score}", True, settings.WHITE)
-            self.canvas.blit(score_text, (10, 10))
-
-            # Apply Shake
-            offset_x = 0
-            offset_y = 0
-            if self.shake_duration > 0:
-                offset_x = random.randint(-self.shake_magnitude, self.shake_magnitude)
-                offset_y = random.randint(-self.shake_magnitude, self.shake_magnitude)
-
-            self.screen.fill(settings.BLACK) # Clear screen before blitting canvas
-            self.screen.blit(self.canvas, (offset_x, offset_y))
-            pygame.display.flip()
-        elif self.game_state == "GAME_OVER":
-            self.draw_game_over_screen()
+        if self.renderer is not None:
+            self.renderer.draw(self)
 
     def run(self):
         while self.active:
@@ -138,47 +122,6 @@ class Game:
 
         pygame.quit()
 
-    # draw splash screen for game start or game over    
-    def draw_splash_screen(self):
-        self.screen.fill(settings.BLACK)
-        title = self.font.render("Breakout", True, settings.WHITE)
-        controls_text = self.font.render("Use LEFT and RIGHT arrows to move", True, settings.GRAY)
-        start_text = self.font.render("Press any key to start", True, settings.WHITE)
-        controls_text = self.font.render("Use Left/Right Arrows to move", True, settings.GRAY)
-        
-        title_rect = title.get_rect(center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 3))
-        controls_rect = controls_text.get_rect(center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 2))
-        start_rect = start_text.get_rect(center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT * 2 // 3))
-        controls_rect = controls_text.get_rect(center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT * 3 // 4))
-        
-        # Add controls hint
-        hint_text = self.font.render("Use arrow keys to move", True, settings.GRAY)
-        hint_rect = hint_text.get_rect(center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 2))
-
-        self.screen.blit(title, title_rect)
-        self.screen.blit(controls_text, controls_rect)
-        self.screen.blit(start_text, start_rect)
-        self.screen.blit(controls_text, controls_rect)
-        pygame.display.flip()
-
-    def draw_game_over_screen(self):
-        self.draw_message_screen("Game Over!", "Press any key to restart")
-
-    def draw_message_screen(self, title_message, subtitle_message):
-        self.screen.fill(settings.BLACK)
-        game_over_text = self.font.render("Game Over!", True, settings.NEON_PINK)
-        score_text = self.font.render(f"Final Score: {self.score}", True, settings.WHITE)
-        restart_text = self.font.render("Press any key to restart", True, settings.WHITE)
-        
-        game_over_rect = game_over_text.get_rect(center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 3))
-        score_rect = score_text.get_rect(center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 2))
-        restart_rect = restart_text.get_rect(center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT * 2 // 3))
-        
-        self.screen.blit(game_over_text, game_over_rect)
-        self.screen.blit(score_text, score_rect)
-        self.screen.blit(restart_text, restart_rect)
-        pygame.display.flip()
-
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -4,9 +4,8 @@ import settings
 class Paddle:
     def __init__(self):
         self.speed = 10 # speed of paddle movement 
-        self.image = pygame.Surface((100,20))
-        self.image.fill(settings.WHITE)
-        self.rect = self.image.get_rect(center = (settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT - 100)) # initialize the paddle at the bottom center of the screen
+        self.rect = pygame.Rect(0, 0, 100, 20)
+        self.rect.center = (settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT - 100) # initialize the paddle at the bottom center of the screen
         
     def move(self, direction):
         # move the paddle in the indicated direction, taking into account the speed
@@ -16,6 +15,3 @@ class Paddle:
     
     def update(self):
         pass
-    
-    def draw(self, screen):
-        screen.blit(self.image, self.rect)    
\ No newline at end of file
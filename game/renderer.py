@@ -0,0 +1,118 @@
+import pygame
+import random
+import settings
+
+class BallRenderer:
+    def draw(self, screen, ball):
+        # Draw trail
+        for i, pos in enumerate(ball.history):
+             alpha = int((i / len(ball.history)) * 255)
+             trail_surface = pygame.Surface((ball.rect.width, ball.rect.height), pygame.SRCALPHA)
+             pygame.draw.circle(trail_surface, (*settings.WHITE, alpha), (ball.rect.width//2, ball.rect.height//2), ball.rect.width//2)
+             screen.blit(trail_surface, (pos[0] - ball.rect.width//2, pos[1] - ball.rect.height//2))
+
+        screen.fill(settings.WHITE, ball.rect)
+
+class PaddleRenderer:
+    def draw(self, screen, paddle):
+        screen.fill(settings.WHITE, paddle.rect)
+
+class BrickRenderer:
+    def draw(self, screen, bricks):
+        for brick in bricks:
+            screen.fill(brick.color, brick.rect)
+            pygame.draw.rect(screen, settings.BLACK, brick.rect, settings.BRICK_BORDER_WIDTH)
+
+class ParticleRenderer:
+    def __init__(self):
+        # one scratch surface shared by every particle instead of one per sprite
+        self.image = pygame.Surface((4, 4))
+
+    def draw(self, screen, particles):
+        for particle in particles:
+            # Fade effect: alpha follows the remaining lifetime
+            self.image.fill(particle.original_color)
+            self.image.set_alpha(int((particle.lifetime / 60) * 255))
+            screen.blit(self.image, particle.rect)
+
+# Owns the window and draws a Game; headless games simply don't create one
+class Renderer:
+    def __init__(self):
+        self.screen = pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+        self.font = pygame.font.Font(None, 36)  # Default font, size 36
+        self.canvas = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+        self.ball_renderer = BallRenderer()
+        self.paddle_renderer = PaddleRenderer()
+        self.brick_renderer = BrickRenderer()
+        self.particle_renderer = ParticleRenderer()
+
+    def draw(self, game):
+        if game.game_state == "SPLASH":
+            self.draw_splash_screen()
+        elif game.game_state == "PLAYING":
+            self.draw_playing(game)
+        elif game.game_state == "GAME_OVER":
+            self.draw_game_over_screen(game)
+
+    def draw_playing(self, game):
+        self.canvas.fill(settings.BLACK)
+        self.paddle_renderer.draw(self.canvas, game.paddle)
+        self.ball_renderer.draw(self.canvas, game.ball)
+        self.brick_renderer.draw(self.canvas, game.bricks)
+        self.particle_renderer.draw(self.canvas, game.particles)
+
+        # Score
+        score_text = self.font.render(f"Score: {game.score}", True, settings.WHITE)
+        self.canvas.blit(score_text, (10, 10))
+
+        # Apply Shake
+        offset_x = 0
+        offset_y = 0
+        if game.shake_duration > 0:
+            offset_x = random.randint(-game.shake_magnitude, game.shake_magnitude)
+            offset_y = random.randint(-game.shake_magnitude, game.shake_magnitude)
+
+        self.screen.fill(settings.BLACK) # Clear screen before blitting canvas
+        self.screen.blit(self.canvas, (offset_x, offset_y))
+        pygame.display.flip()
+
+    # draw splash screen for game start or game over
+    def draw_splash_screen(self):
+        self.screen.fill(settings.BLACK)
+        title = self.font.render("Breakout", True, settings.WHITE)
+        controls_text = self.font.render("Use LEFT and RIGHT arrows to move", True, settings.GRAY)
+        start_text = self.font.render("Press any key to start", True, settings.WHITE)
+        controls_text = self.font.render("Use Left/Right Arrows to move", True, settings.GRAY)
+
+        title_rect = title.get_rect(center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 3))
+        controls_rect = controls_text.get_rect(center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 2))
+        start_rect = start_text.get_rect(center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT * 2 // 3))
+        controls_rect = controls_text.get_rect(center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT * 3 // 4))
+
+        # Add controls hint
+        hint_text = self.font.render("Use arrow keys to move", True, settings.GRAY)
+        hint_rect = hint_text.get_rect(center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 2))
+
+        self.screen.blit(title, title_rect)
+        self.screen.blit(controls_text, controls_rect)
+        self.screen.blit(start_text, start_rect)
+        self.screen.blit(controls_text, controls_rect)
+        pygame.display.flip()
+
+    def draw_game_over_screen(self, game):
+        self.draw_message_screen(game, "Game Over!", "Press any key to restart")
+
+    def draw_message_screen(self, game, title_message, subtitle_message):
+        self.screen.fill(settings.BLACK)
+        game_over_text = self.font.render("Game Over!", True, settings.NEON_PINK)
+        score_text = self.font.render(f"Final Score: {game.score}", True, settings.WHITE)
+        restart_text = self.font.render("Press any key to restart", True, settings.WHITE)
+
+        game_over_rect = game_over_text.get_rect(center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 3))
+        score_rect = score_text.get_rect(center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 2))
+        restart_rect = restart_text.get_rect(center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT * 2 // 3))
+
+        self.screen.blit(game_over_text, game_over_rect)
+        self.screen.blit(score_text, score_rect)
+        self.screen.blit(restart_text, restart_rect)
+        pygame.display.flip()
@@ -0,0 +1,91 @@
+import argparse
+import csv
+import os
+import random
+from multiprocessing import Pool
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import settings
+from game.game import Game
+
+RESULT_FIELDS = ["seed", "score", "frames", "bricks_destroyed"]
+
+
+def bot_direction(game, aim):
+    # simple tracking bot: keep the paddle under the ball, off centre by `aim` pixels
+    offset = game.ball.rect.centerx - game.paddle.rect.centerx - aim
+    if offset < -game.paddle.speed:
+        return -1
+    if offset > game.paddle.speed:
+        return 1
+    return 0
+
+
+def run_game(seed, max_frames):
+    # every game gets its own seed so a sweep is reproducible whatever worker runs it
+    random.seed(seed)
+    game = Game(headless=True)
+    frames = 0
+    aim = 0
+    descending = False
+    while game.game_state == "PLAYING" and frames < max_frames:
+        # pick a new hit point on the paddle for every return so seeds play out differently
+        if game.ball.velocity_y > 0 and not descending:
+            aim = random.uniform(-40, 40)
+        descending = game.ball.velocity_y > 0
+        direction = bot_direction(game, aim)
+        if direction:
+            game.paddle.move(direction)
+        game.update(1 / settings.FPS)
+        frames += 1
+    return {"seed": seed, "score": game.score, "frames": frames, "bricks_destroyed": game.bricks_destroyed}
+
+
+def _run_game(args):
+    return run_game(*args)
+
+
+def load_finished_seeds(path):
+    if not os.path.exists(path):
+        return set()
+    with open(path, newline="") as f:
+        # a row cut short by an interrupted write is ignored and simulated again
+        return {int(row["seed"]) for row in csv.DictReader(f) if all(row.get(field) for field in RESULT_FIELDS)}
+
+
+def run_sweep(seeds, output, max_frames, workers=None):
+    # results are appended and flushed one game at a time, so the output file is
+    # also the checkpoint: rerunning the same sweep skips seeds already written
+    finished = load_finished_seeds(output)
+    pending = [(seed, max_frames) for seed in seeds if seed not in finished]
+    new_file = not os.path.exists(output) or os.path.getsize(output) == 0
+
+    with open(output, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        if new_file:
+            writer.writeheader()
+        with Pool(workers) as pool:
+            for result in pool.imap_unordered(_run_game, pending, chunksize=4):
+                writer.writerow(result)
+                f.flush()
+
+    return len(finished), len(pending)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run seeded headless games across all cores.")
+    parser.add_argument("--games", type=int, default=1000, help="number of games to simulate")
+    parser.add_argument("--first-seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--max-frames", type=int, default=settings.FPS * 60 * 10, help="frame cap per game")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--output", default="simulation_results.csv", help="result table, also used to resume")
+    args = parser.parse_args()
+
+    seeds = range(args.first_seed, args.first_seed + args.games)
+    skipped, ran = run_sweep(seeds, args.output, args.max_frames, args.workers)
+    print(f"Simulated {ran} games ({skipped} already in {args.output})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from game.batch import BatchGame, BRICK_COLUMNS
+from game.game import Game
+
+
+class TestBatchGame:
+    def test_matches_headless_game(self):
+        # a vertical rally stays on whole pixels, so the batch must track Game exactly
+        game = Game(headless=True)
+        batch = BatchGame(1, seed=0)
+        for _ in range(4000):
+            if game.game_state != "PLAYING":
+                break
+            game.update(1 / 60)
+            batch.step(np.zeros(1, dtype=int), 1 / 60)
+            assert batch.ball_y[0] == game.ball.rect.y
+            assert batch.velocity_y[0] == game.ball.velocity_y
+            assert batch.score[0] == game.score
+        assert batch.game_over[0] == (game.game_state == "GAME_OVER")
+
+    def test_games_are_independent(self):
+        batch = BatchGame(3, seed=0)
+        directions = np.array([-1, 0, 1])
+        for _ in range(10):
+            batch.step(directions)
+        assert batch.paddle_x[0] < batch.paddle_x[1] < batch.paddle_x[2]
+
+    def test_row_reaching_paddle_ends_game(self):
+        batch = BatchGame(2, seed=0)
+        batch.row_live[0, 0] = True
+        batch.bricks[0, 0] = True
+        batch.row_y[0, 0] = batch.paddle_y - 50
+        batch.step()
+        assert batch.game_over.tolist() == [True, False]
+
+        frames = batch.frames.copy()
+        batch.step()
+        assert batch.frames[0] == frames[0]
+        assert batch.frames[1] == frames[1] + 1
+
+    def test_brick_hit_scores_and_bounces(self):
+        batch = BatchGame(1, seed=0)
+        batch.row_live[0, 0] = True
+        batch.bricks[0, 0] = True
+        batch.row_y[0, 0] = 100.0
+        batch.ball_x[0] = 10.0
+        batch.ball_y[0] = 153.0
+        batch.step()
+        assert batch.bricks[0, 0].sum() == BRICK_COLUMNS - 1
+        assert batch.score[0] == 10
+        assert batch.velocity_y[0] == pytest.approx(5)
+
+    def test_reset_mask(self):
+        batch = BatchGame(2, seed=0)
+        batch.score[:] = 50
+        batch.game_over[:] = True
+        batch.reset(np.array([True, False]))
+        assert batch.score.tolist() == [0, 50]
+        assert batch.game_over.tolist() == [False, True]
@@ -57,5 +57,20 @@ class TestGame(unittest.TestCase):
         expected_frequency = (vertical_gap / settings.BRICK_SPEED) * 1000
         self.assertEqual(game.brick_frequency, expected_frequency)
 
+    def test_headless_game_runs_without_display(self):
+        with patch('game.renderer.pygame.display.set_mode') as mock_set_mode:
+            game = Game(headless=True)
+            for _ in range(1200):
+                game.update(1 / 60)
+
+        mock_set_mode.assert_not_called()
+        self.assertIsNone(game.renderer)
+        self.assertFalse(hasattr(game.ball, "image"))
+        self.assertFalse(hasattr(game.paddle, "image"))
+        # 20 simulated seconds at 10 px/s leaves room for at least one spawned row
+        self.assertGreater(len(game.bricks), 0)
+        for brick in game.bricks:
+            self.assertFalse(hasattr(brick, "image"))
+
 if __name__ == '__main__':
     unittest.main()
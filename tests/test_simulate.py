@@ -0,0 +1,17 @@
+import csv
+from simulate import load_finished_seeds, run_game, run_sweep
+
+
+def test_run_game_is_deterministic_per_seed():
+    assert run_game(7, 1200) == run_game(7, 1200)
+
+
+def test_sweep_resumes_from_checkpoint(tmp_path):
+    output = tmp_path / "results.csv"
+    assert run_sweep(range(3), str(output), 300, workers=2) == (0, 3)
+    assert run_sweep(range(5), str(output), 300, workers=2) == (3, 2)
+
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert sorted(int(row["seed"]) for row in rows) == [0, 1, 2, 3, 4]
+    assert load_finished_seeds(str(output)) == {0, 1, 2, 3, 4}